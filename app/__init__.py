@@ -1 +1,5 @@
 # package marker
+import time
+
+# Taken before any app module loads; the lifespan reports the time from here as the "import" phase.
+IMPORT_STARTED = time.perf_counter()
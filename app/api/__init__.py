@@ -1,3 +1,4 @@
 from app.api.faq import router as faq_router
+from app.api.health import router as health_router
 
-__all__ = ["faq_router"]
+__all__ = ["faq_router", "health_router"]
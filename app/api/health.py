@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+
+
+router = APIRouter(tags=["health"])
+
+
+@router.get("/healthz")
+async def healthz() -> dict[str, str]:
+    return {"status": "ok"}
+
+
+@router.get("/readyz")
+async def readyz(request: Request) -> JSONResponse:
+    ready = getattr(request.app.state, "ready", False)
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "status": "ready" if ready else "starting",
+            "startup_ms": getattr(request.app.state, "startup_timings", {}),
+        },
+    )
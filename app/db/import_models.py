@@ -1 +0,0 @@
-from app.models import *  # noqa: F401,F403
@@ -0,0 +1,42 @@
+from sqlalchemy import Column, Integer, Table, func, insert, inspect, select
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from app.db.base import Base
+from app.models import entities  # noqa: F401  registers tables on Base.metadata
+
+
+# Bump together with sql/schema.sql whenever the table layout changes.
+SCHEMA_VERSION = 1
+
+schema_version = Table(
+    "schema_version",
+    Base.metadata,
+    Column("version", Integer, primary_key=True),
+)
+
+
+class SchemaVersionMismatch(RuntimeError):
+    pass
+
+
+async def verify_schema(conn: AsyncConnection) -> None:
+    """Check the stored schema version with a single query instead of running DDL."""
+    # Checked up front so permission, lock and connection errors from the SELECT
+    # surface as themselves instead of looking like a missing table.
+    if not await conn.run_sync(lambda sync_conn: inspect(sync_conn).has_table(schema_version.name)):
+        raise SchemaVersionMismatch("schema_version table is missing; apply sql/schema.sql first")
+    result = await conn.execute(select(func.max(schema_version.c.version)))
+    current = result.scalar_one_or_none()
+    if current != SCHEMA_VERSION:
+        raise SchemaVersionMismatch(
+            f"database schema version is {current}, expected {SCHEMA_VERSION}; apply sql/schema.sql first"
+        )
+
+
+async def create_schema(conn: AsyncConnection) -> None:
+    """Create all tables and stamp the version. Intended for local development only."""
+    await conn.run_sync(Base.metadata.create_all)
+    result = await conn.execute(select(func.max(schema_version.c.version)))
+    if result.scalar_one_or_none() is None:
+        await conn.execute(insert(schema_version).values(version=SCHEMA_VERSION))
+    await verify_schema(conn)
@@ -1,7 +1,13 @@
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from app.settings import settings
 
 
-engine = create_async_engine(settings.database_url, echo=False, future=True)
+engine_kwargs = {}
+if make_url(settings.database_url).get_backend_name() != "sqlite":
+    # SQLite may get StaticPool/NullPool, which reject QueuePool sizing arguments.
+    engine_kwargs["pool_size"] = settings.db_pool_size
+
+engine = create_async_engine(settings.database_url, echo=False, future=True, **engine_kwargs)
 AsyncSessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
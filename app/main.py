@@ -1,23 +1,41 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 import uvicorn
 from fastapi import FastAPI
 
-from app.api import faq_router
-from app.db.base import Base
-from app.db.import_models import *  # noqa: F401,F403
-from app.db.session import engine
+from app import IMPORT_STARTED
+from app.api import faq_router, health_router
+from app.db.session import AsyncSessionLocal, engine
+from app.settings import settings
+from app.startup import StartupTimer, prepare_schema, warm_up
 
 
 @asynccontextmanager
-async def lifespan(_: FastAPI):
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    yield
+async def lifespan(app: FastAPI):
+    app.state.ready = False
+    timer = StartupTimer(IMPORT_STARTED)
+    app.state.startup_timings = timer.timings
+    # Schema verification is a single query and must fail the boot; warm-up runs
+    # while the server already answers /healthz and /readyz.
+    with timer.phase("schema"):
+        await prepare_schema(engine, auto_create=settings.auto_create_schema)
+    warmup = asyncio.create_task(
+        warm_up(app.state, timer, engine, AsyncSessionLocal, pool_size=settings.db_pool_size)
+    )
+    try:
+        yield
+    finally:
+        app.state.ready = False
+        warmup.cancel()
+        with suppress(asyncio.CancelledError):
+            await warmup
+        await engine.dispose()
 
 
 app = FastAPI(title="FAQ Service", version="0.1.0", lifespan=lifespan)
+app.include_router(health_router)
 app.include_router(faq_router)
 
 if __name__ == "__main__":
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
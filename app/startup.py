@@ -0,0 +1,113 @@
+import asyncio
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import AsyncExitStack, contextmanager
+
+from fastapi.datastructures import State
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+from sqlalchemy.orm import configure_mappers
+from sqlalchemy.pool import QueuePool
+
+from app.db.schema import create_schema, verify_schema
+from app.repositories.faq_repository import FaqRepository
+
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimer:
+    def __init__(self, import_started: float | None = None) -> None:
+        now = time.perf_counter()
+        self.timings: dict[str, float] = {}
+        self.started = now if import_started is None else import_started
+        if import_started is not None:
+            self.timings["import"] = round((now - import_started) * 1000, 2)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = round((time.perf_counter() - start) * 1000, 2)
+
+    def finish(self) -> None:
+        self.timings["total"] = round((time.perf_counter() - self.started) * 1000, 2)
+
+
+async def prepare_schema(engine: AsyncEngine, *, auto_create: bool) -> None:
+    async with engine.begin() as conn:
+        if auto_create:
+            await create_schema(conn)
+        else:
+            await verify_schema(conn)
+
+
+def _pool_capacity(engine: AsyncEngine, requested: int) -> int:
+    # Only connections kept by a QueuePool survive checkin; overflow connections
+    # are closed on return and StaticPool/NullPool hold at most one.
+    pool = engine.pool
+    if isinstance(pool, QueuePool):
+        return min(requested, pool.size())
+    return min(requested, 1)
+
+
+async def warm_pool(engine: AsyncEngine, size: int) -> None:
+    """Open up to ``size`` pooled connections concurrently so the first requests do not pay for connect/auth."""
+    size = _pool_capacity(engine, size)
+    async with AsyncExitStack() as stack:
+        results = await asyncio.gather(
+            *(stack.enter_async_context(engine.connect()) for _ in range(size)),
+            return_exceptions=True,
+        )
+        errors = [item for item in results if isinstance(item, BaseException)]
+        if errors:
+            raise errors[0]
+        await asyncio.gather(*(conn.execute(text("SELECT 1")) for conn in results))
+
+
+async def warm_caches(session_factory: async_sessionmaker) -> None:
+    """Configure mappers and compile the FAQ get/list statements, including their selectin loaders.
+
+    The loader statements only run when rows come back, so they are warmed from an existing
+    FAQ; on an empty database only the top-level SELECTs are compiled.
+    """
+    configure_mappers()
+    async with session_factory() as session:
+        repo = FaqRepository(session)
+        sample = await repo.list(limit=1)
+        if not sample:
+            await repo.get(0)
+            return
+        faq = sample[0]
+        await repo.get(faq.id)
+        await repo.list(category_id=faq.category_id, limit=1)
+        if faq.faq_tags:
+            await repo.list(tag_id=faq.faq_tags[0].tag_id, limit=1)
+
+
+async def warm_up(
+    state: State,
+    timer: StartupTimer,
+    engine: AsyncEngine,
+    session_factory: async_sessionmaker,
+    *,
+    pool_size: int,
+) -> None:
+    """Warm the pool and caches in the background, then flip ``state.ready``."""
+    try:
+        with timer.phase("pool"):
+            await warm_pool(engine, pool_size)
+        with timer.phase("caches"):
+            await warm_caches(session_factory)
+    except Exception as exc:
+        # Cancelling mid-connect can surface as a driver error; that is a shutdown, not a failure.
+        if asyncio.current_task().cancelling():
+            raise asyncio.CancelledError from exc
+        logger.exception("startup warm-up failed; service stays not ready")
+        return
+    timer.finish()
+    state.ready = True
+    logger.info("startup finished in %.2f ms: %s", timer.timings["total"], timer.timings)
@@ -0,0 +1,56 @@
+"""Boot the service in fresh interpreters and report the per-phase startup breakdown.
+
+Usage:
+    AUTO_CREATE_SCHEMA=1 DATABASE_URL=sqlite+aiosqlite:// python -m benchmarks.startup --runs 5
+
+Each run prints the ``startup_ms`` body of ``/readyz`` as one JSON line; the last line is the
+per-phase median, suitable for diffing between commits.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+
+BOOT = """
+import json, time
+from fastapi.testclient import TestClient
+from app.main import app
+
+with TestClient(app) as client:
+    deadline = time.monotonic() + 60
+    while True:
+        resp = client.get("/readyz")
+        if resp.status_code == 200:
+            break
+        if time.monotonic() > deadline:
+            raise SystemExit("service did not become ready")
+        time.sleep(0.005)
+    print(json.dumps(resp.json()["startup_ms"]))
+"""
+
+
+def boot_once() -> dict[str, float]:
+    result = subprocess.run([sys.executable, "-c", BOOT], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    runs = []
+    for _ in range(args.runs):
+        timings = boot_once()
+        runs.append(timings)
+        print(json.dumps(timings))
+
+    median = {phase: round(statistics.median(run[phase] for run in runs), 2) for phase in runs[0]}
+    print(json.dumps({"median": median}))
+
+
+if __name__ == "__main__":
+    main()
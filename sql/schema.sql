@@ -70,3 +70,9 @@ CREATE TABLE faq_answers (
         FOREIGN KEY (faq_id) REFERENCES faqs(id) ON DELETE CASCADE,
     INDEX idx_faq_answers_faq_active (faq_id, is_active)
 );
+
+CREATE TABLE schema_version (
+    version INT PRIMARY KEY
+);
+
+INSERT INTO schema_version (version) VALUES (1);
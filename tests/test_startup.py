@@ -0,0 +1,212 @@
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+os.environ["DATABASE_URL"] = "sqlite+aiosqlite:///./test_faq_api.db"
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.db.base import Base
+from app.db.schema import SCHEMA_VERSION, SchemaVersionMismatch, create_schema, schema_version
+from app.db.session import AsyncSessionLocal, engine
+from app.main import app
+from app.models.entities import Category, Faq, FaqAnswer, FaqTag, SimilarQuestion, Tag
+from app.startup import warm_caches, warm_pool
+
+
+async def reset_db(*, stamp_version: bool = True) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        if stamp_version:
+            await create_schema(conn)
+        else:
+            await conn.run_sync(Base.metadata.create_all)
+
+
+async def drop_schema_version() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(schema_version.drop)
+
+
+async def seed_faq() -> None:
+    async with AsyncSessionLocal() as session:
+        category = Category(name="General", sort_order=0)
+        tag = Tag(name="billing")
+        session.add_all([category, tag])
+        await session.flush()
+        faq = Faq(category_id=category.id, standard_question="How to pay invoice?")
+        session.add(faq)
+        await session.flush()
+        session.add_all(
+            [
+                FaqTag(faq_id=faq.id, tag_id=tag.id),
+                SimilarQuestion(faq_id=faq.id, question_text="pay bill"),
+                FaqAnswer(faq_id=faq.id, answer_type="text", answer_content="Use the billing page"),
+            ]
+        )
+        await session.commit()
+
+
+class TestStartup(unittest.TestCase):
+    @classmethod
+    def tearDownClass(cls) -> None:
+        asyncio.run(engine.dispose())
+
+    def _wait_ready(self, client: TestClient) -> dict:
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            resp = client.get("/readyz")
+            if resp.status_code == 200:
+                return resp.json()
+            time.sleep(0.01)
+        self.fail("service did not become ready")
+
+    def test_readyz_reports_startup_breakdown(self) -> None:
+        asyncio.run(reset_db())
+
+        with TestClient(app) as client:
+            body = self._wait_ready(client)
+            self.assertEqual(body["status"], "ready")
+            self.assertEqual(set(body["startup_ms"]), {"import", "schema", "pool", "caches", "total"})
+
+            health = client.get("/healthz")
+            self.assertEqual(health.status_code, 200, health.text)
+
+        self.assertFalse(app.state.ready)
+
+    def test_readyz_not_ready_while_warming_up(self) -> None:
+        asyncio.run(reset_db())
+        release = threading.Event()
+
+        async def blocked_warm_caches(_) -> None:
+            while not release.is_set():
+                await asyncio.sleep(0.01)
+
+        with patch("app.startup.warm_caches", blocked_warm_caches):
+            with TestClient(app) as client:
+                self.assertEqual(client.get("/healthz").status_code, 200)
+                resp = client.get("/readyz")
+                self.assertEqual(resp.status_code, 503, resp.text)
+                self.assertEqual(resp.json()["status"], "starting")
+
+                release.set()
+                self._wait_ready(client)
+
+    def test_shutdown_cancels_pending_warm_up(self) -> None:
+        asyncio.run(reset_db())
+
+        async def never_warm(_) -> None:
+            await asyncio.Event().wait()
+
+        with self.assertNoLogs("app.startup", "ERROR"):
+            with patch("app.startup.warm_caches", never_warm):
+                with TestClient(app) as client:
+                    self.assertEqual(client.get("/readyz").status_code, 503)
+
+        self.assertFalse(app.state.ready)
+
+    def test_shutdown_during_pool_warm_up_is_not_a_failure(self) -> None:
+        asyncio.run(reset_db())
+
+        async def connect_interrupted(*_args) -> None:
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                raise OperationalError("SELECT 1", {}, Exception("no active connection"))
+
+        with self.assertNoLogs("app.startup", "ERROR"):
+            with patch("app.startup.warm_pool", connect_interrupted):
+                with TestClient(app) as client:
+                    self.assertEqual(client.get("/readyz").status_code, 503)
+
+        self.assertFalse(app.state.ready)
+
+    def test_startup_fails_on_schema_version_mismatch(self) -> None:
+        asyncio.run(reset_db(stamp_version=False))
+
+        with self.assertRaises(SchemaVersionMismatch):
+            with TestClient(app):
+                pass
+
+    def test_auto_create_fails_on_stale_schema_version(self) -> None:
+        async def run() -> None:
+            async with engine.begin() as conn:
+                await conn.execute(update(schema_version).values(version=SCHEMA_VERSION + 1))
+            async with engine.begin() as conn:
+                await create_schema(conn)
+
+        asyncio.run(reset_db())
+        with self.assertRaises(SchemaVersionMismatch):
+            asyncio.run(run())
+
+    def test_startup_fails_when_schema_version_table_missing(self) -> None:
+        asyncio.run(reset_db(stamp_version=False))
+        asyncio.run(drop_schema_version())
+
+        with self.assertRaisesRegex(SchemaVersionMismatch, "schema_version table is missing"):
+            with TestClient(app):
+                pass
+
+    def test_warm_pool_is_capped_at_pool_size(self) -> None:
+        async def run() -> int:
+            small = create_async_engine("sqlite+aiosqlite:///./test_faq_api.db", pool_size=2, pool_timeout=1)
+            try:
+                await warm_pool(small, 50)
+                return small.pool.checkedin()
+            finally:
+                await small.dispose()
+
+        self.assertEqual(asyncio.run(run()), 2)
+
+    def test_warm_caches_runs_loader_queries_for_existing_faq(self) -> None:
+        asyncio.run(reset_db())
+        asyncio.run(seed_faq())
+        statements: list[str] = []
+
+        def record(_conn, _cursor, statement, *_args) -> None:
+            statements.append(statement)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", record)
+        try:
+            asyncio.run(warm_caches(AsyncSessionLocal))
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+        executed = " ".join(statements)
+        for table in ("similar_questions", "faq_tags", "tags", "faq_answers"):
+            self.assertIn(f"FROM {table}", executed)
+
+    def test_crud_import_does_not_load_matching_deps(self) -> None:
+        code = (
+            "import sys, app.main; "
+            "heavy = {'torch', 'transformers', 'numpy', 'pandas', 'sklearn'} & set(sys.modules); "
+            "print(','.join(sorted(heavy)))"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip(), "")
+
+    def test_in_memory_sqlite_starts(self) -> None:
+        code = (
+            "import time; from fastapi.testclient import TestClient; from app.main import app\n"
+            "with TestClient(app) as client:\n"
+            "    deadline = time.monotonic() + 5\n"
+            "    while client.get('/readyz').status_code != 200:\n"
+            "        assert time.monotonic() < deadline, 'not ready'\n"
+            "        time.sleep(0.01)\n"
+        )
+        env = {**os.environ, "DATABASE_URL": "sqlite+aiosqlite://", "AUTO_CREATE_SCHEMA": "1"}
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env)
+        self.assertEqual(result.returncode, 0, result.stderr)
+
+
+if __name__ == "__main__":
+    unittest.main()